@@ -1,23 +1,21 @@
 """The bot is designed to demonstrate how to use the carousel widget."""
 
-from hammett.core import Application
 from hammett.core.constants import DEFAULT_STATE
 
 from demos.carousel.screens import MainMenu
+from demos.runner import run_demo
 
 
 def main():
     """Runs the bot. """
 
-    name = 'carousel'
-    app = Application(
-        name,
+    run_demo(
+        'carousel',
         entry_point=MainMenu,
         states={
             DEFAULT_STATE: [MainMenu],
         },
     )
-    app.run()
 
 
 if __name__ == '__main__':
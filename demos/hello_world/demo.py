@@ -1,21 +1,14 @@
-from hammett.core import Application, Button
+from hammett.core import Button
 from hammett.core.constants import DEFAULT_STATE, SourcesTypes
 from hammett.core.mixins import StartMixin
 from hammett.core.screen import Screen
 
+from demos.runner import run_demo
+
 
 class HelloScreen(StartMixin, Screen):
     description = 'Hello, World!'
 
-    async def add_default_keyboard(self, _update, _context):
-        return [[
-            Button(
-                'Next screen ➡️',
-                YetAnotherScreen,
-                source_type=SourcesTypes.GOTO_SOURCE_TYPE,
-            )
-        ]]
-
 
 class YetAnotherScreen(StartMixin, Screen):
     description = (
@@ -23,28 +16,37 @@ class YetAnotherScreen(StartMixin, Screen):
         'capability to switch between screens.'
     )
 
-    async def add_default_keyboard(self, _update, _context):
-        return [[
-            Button(
-                '⬅️ Back',
-                HelloScreen,
-                source_type=SourcesTypes.GOTO_SOURCE_TYPE,
-            )
-        ]]
+
+# The keyboards don't depend on the user, so create the buttons only once.
+# It's done below the screens, since the screens refer to each other.
+
+HelloScreen.keyboard = ((
+    Button(
+        'Next screen ➡️',
+        YetAnotherScreen,
+        source_type=SourcesTypes.GOTO_SOURCE_TYPE,
+    ),
+),)
+
+YetAnotherScreen.keyboard = ((
+    Button(
+        '⬅️ Back',
+        HelloScreen,
+        source_type=SourcesTypes.GOTO_SOURCE_TYPE,
+    ),
+),)
 
 
 def main():
     """Runs the bot."""
 
-    name = 'hello_world'
-    app = Application(
-        name,
+    run_demo(
+        'hello_world',
         entry_point=HelloScreen,
         states={
             DEFAULT_STATE: [HelloScreen, YetAnotherScreen],
         },
     )
-    app.run()
 
 
 if __name__ == '__main__':
@@ -11,44 +11,47 @@ from hammett.core.mixins import StartMixin
 
 LOGGER = logging.getLogger('hammett')
 
+_ADMIN_TEXT = (
+    'Hello, <b>{user_status}</b>!\n\n'
+    'Your status allows you to see all the buttons of the main menu.'
+)
+
+_ANONYMOUS_TEXT = (
+    'Hello, <b>{user_status}</b>!\n\n'
+    "Your status doesn't allow you to see the hidden buttons of the main menu."
+)
+
 
 class NotAdminConfirmation(Screen):
     description = 'Are you sure you want to remove yourself from the admin group?'
 
-    async def add_default_keyboard(self, _update, _context):
-        return [
-            [
-                Button('✅ Yes', self.exclude_user_from_admin_group),
-                Button('⬅️ Main Menu', MainMenu,
-                       source_type=SourcesTypes.GOTO_SOURCE_TYPE),
-            ],
-        ]
-
     @staticmethod
     @register_button_handler
     async def exclude_user_from_admin_group(update, context):
         main_menu = MainMenu()
         user = update.effective_user
 
-        settings.ADMIN_GROUP.remove(user.id)
+        settings.ADMIN_GROUP.discard(user.id)
 
-        await main_menu.goto(update, context)
+        # Don't make the handler wait for the main menu to be re-rendered.
+        # Unlike asyncio.create_task, the application keeps a reference
+        # to the task and passes its exceptions to the error handlers.
+        # Note that the demo gives up the per-chat ordering of updates here
+        # on purpose: the render runs outside of the handler, so the next
+        # update from the user may be processed before the main menu is
+        # re-rendered, even if CONCURRENT_UPDATES is enabled.
+        context.application.create_task(main_menu.goto(update, context), update=update)
         return DEFAULT_STATE
 
 
 class MainMenu(StartMixin, Screen):
     admin_status = 'admin'
     anonymous_status = 'anonymous'
-    greeting = 'Hello, <b>{user_status}</b>!'
-    text_map = {
-        admin_status: (
-            f'{greeting}\n\n'
-            f'Your status allows you to see all the buttons of the main menu.'
-        ),
-        anonymous_status: (
-            f'{greeting}\n\n'
-            f"Your status doesn't allow you to see the hidden buttons of the main menu."
-        ),
+    # There are only two statuses, so format the descriptions in advance
+    # instead of doing it on every render.
+    rendered_text_map = {
+        admin_status: _ADMIN_TEXT.format(user_status=admin_status),
+        anonymous_status: _ANONYMOUS_TEXT.format(user_status=anonymous_status),
     }
 
     #
@@ -68,42 +71,21 @@ class MainMenu(StartMixin, Screen):
     async def get_config(self, update, _context, **_kwargs):
         user = update.effective_user
         user_status = await self._get_user_status(user.id)
-        description = self.text_map[user_status].format(user_status=user_status)
 
         config = RenderConfig()
-        config.description = description
+        config.description = self.rendered_text_map[user_status]
 
         return config
 
-    async def add_default_keyboard(self, _update, _context):
-        return [
-            [
-                Button('🔒 Available only for admins', SecretRoom,
-                       hiders=Hider(ONLY_FOR_ADMIN),
-                       source_type=SourcesTypes.GOTO_SOURCE_TYPE),
-            ],
-            [
-                Button("❌ I'm not an admin!", NotAdminConfirmation,
-                       hiders=Hider(ONLY_FOR_ADMIN),
-                       source_type=SourcesTypes.GOTO_SOURCE_TYPE),
-            ],
-            [
-                Button('🎸 Hammett Home Page', 'https://github.com/cusdeb-com/hammett',
-                       source_type=SourcesTypes.URL_SOURCE_TYPE),
-            ],
-        ]
-
     async def start(self, update, context):
         """Replies to the /start command. """
 
-        try:
-            user = update.message.from_user
-        except AttributeError:
-            # When the start handler is invoked through editing
-            # the message with the /start command.
-            user = update.edited_message.from_user
+        # The message is None when the start handler is invoked through
+        # editing the message with the /start command.
+        message = update.message or update.edited_message
+        user = message.from_user
 
-        settings.ADMIN_GROUP.append(user.id)
+        settings.ADMIN_GROUP.add(user.id)
         LOGGER.info('The user %s (%s) was added to the admin group.', user.username, user.id)
 
         return await super().start(update, context)
@@ -112,10 +94,40 @@ class MainMenu(StartMixin, Screen):
 class SecretRoom(Screen):
     description = 'This is the secret room available only for admins.'
 
-    async def add_default_keyboard(self, _update, _context):
-        return [
-            [
-                Button('⬅️ Main Menu', MainMenu,
-                       source_type=SourcesTypes.GOTO_SOURCE_TYPE),
-            ],
-        ]
+
+# The keyboards are the same for every user (the visibility of the buttons
+# is specified when rendering), so there is no need to build them on every
+# render. The buttons are created below the screens they refer to.
+
+_MAIN_MENU_BUTTON = Button('⬅️ Main Menu', MainMenu,
+                           source_type=SourcesTypes.GOTO_SOURCE_TYPE)
+
+MainMenu.keyboard = (
+    (
+        Button('🔒 Available only for admins', SecretRoom,
+               hiders=Hider(ONLY_FOR_ADMIN),
+               source_type=SourcesTypes.GOTO_SOURCE_TYPE),
+    ),
+    (
+        Button("❌ I'm not an admin!", NotAdminConfirmation,
+               hiders=Hider(ONLY_FOR_ADMIN),
+               source_type=SourcesTypes.GOTO_SOURCE_TYPE),
+    ),
+    (
+        Button('🎸 Hammett Home Page', 'https://github.com/cusdeb-com/hammett',
+               source_type=SourcesTypes.URL_SOURCE_TYPE),
+    ),
+)
+
+NotAdminConfirmation.keyboard = (
+    (
+        Button('✅ Yes', NotAdminConfirmation.exclude_user_from_admin_group),
+        _MAIN_MENU_BUTTON,
+    ),
+)
+
+SecretRoom.keyboard = (
+    (
+        _MAIN_MENU_BUTTON,
+    ),
+)
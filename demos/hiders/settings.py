@@ -1,6 +1,6 @@
 import os
 
-ADMIN_GROUP = []
+ADMIN_GROUP = set()
 
 HIDERS_CHECKER = 'demos.hiders.hiders_checker.DemoHidersChecker'
 
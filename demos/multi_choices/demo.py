@@ -1,23 +1,21 @@
 """The bot is designed to demonstrate how to use the multichoice widget."""
 
-from hammett.core import Application
 from hammett.core.constants import DEFAULT_STATE
 
 from demos.multi_choices.screens import MainMenu
+from demos.runner import run_demo
 
 
 def main():
     """Runs the bot."""
 
-    name = 'multi_choices'
-    app = Application(
-        name,
+    run_demo(
+        'multi_choices',
         entry_point=MainMenu,
         states={
             DEFAULT_STATE: [MainMenu],
         },
     )
-    app.run()
 
 
 if __name__ == '__main__':
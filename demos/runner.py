@@ -0,0 +1,14 @@
+"""The module contains the routine for running the demo bots."""
+
+from hammett.core import Application
+
+
+def run_demo(name, entry_point, states):
+    """Runs the demo bot with the specified name. """
+
+    app = Application(
+        name,
+        entry_point=entry_point,
+        states=states,
+    )
+    app.run()
@@ -1,23 +1,21 @@
 """The bot is designed to demonstrate how to use the single choice widget."""
 
-from hammett.core import Application
 from hammett.core.constants import DEFAULT_STATE
 
 from demos.single_choices.screens import MainMenu
+from demos.runner import run_demo
 
 
 def main():
     """Runs the bot."""
 
-    name = 'single_choice'
-    app = Application(
-        name,
+    run_demo(
+        'single_choice',
         entry_point=MainMenu,
         states={
             DEFAULT_STATE: [MainMenu],
         },
     )
-    app.run()
 
 
 if __name__ == '__main__':
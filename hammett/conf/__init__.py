@@ -53,6 +53,9 @@ _EMPTY = object()
 
 _HAMMETT_SETTINGS_MODULE = 'HAMMETT_SETTINGS_MODULE'
 
+# The names of the global settings don't change, so find them only once.
+_GLOBAL_SETTINGS_NAMES = tuple(name for name in vars(global_settings) if name.isupper())
+
 
 def new_method_proxy(func: 'Func') -> 'Any':
     """Route functions to the _wrapped object."""
@@ -74,6 +77,13 @@ class GlobalSettings:
     the global settings.
     """
 
+    def __init__(self: 'Self') -> None:
+        """Initialize a global settings object."""
+        # Copy the settings, so that reading them doesn't involve __getattr__.
+        self.__dict__.update({
+            setting: getattr(global_settings, setting) for setting in _GLOBAL_SETTINGS_NAMES
+        })
+
     def __getattr__(self: 'Self', name: str) -> 'Any':
         """Return the value of a global setting."""
         return getattr(global_settings, name)
@@ -176,6 +186,14 @@ class LazySettings(LazyObject):
 
         self._wrapped = Settings(settings_module)
 
+        # Cache all the settings at once, so that reading any of them
+        # doesn't involve __getattr__.
+        self.__dict__.update({
+            setting: setting_value
+            for setting, setting_value in vars(self._wrapped).items()
+            if setting.isupper()
+        })
+
     def __repr__(self: 'Self') -> str:
         """Return a system representation of a lazy setting."""
         # Hardcode the class name as otherwise it yields 'Settings'.
@@ -222,33 +240,38 @@ class Settings:
         """Initialize a settings object."""
         self.settings_module_name = settings_module
 
-        self._explicit_settings = set()
         self._settings_module = importlib.import_module(self.settings_module_name)
 
-        # update this dict from global settings (but only for ALL_CAPS settings)
-        for setting in dir(global_settings):
-            if setting.isupper():
-                setattr(self, setting, getattr(global_settings, setting))
+        # Unlike dir(), vars() neither sorts the names nor makes it necessary
+        # to get the values separately.
+        user_settings = {
+            setting: setting_value
+            for setting, setting_value in vars(self._settings_module).items()
+            if setting.isupper()
+        }
 
-        for setting in dir(self._settings_module):
-            if setting.isupper():
-                setting_value = getattr(self._settings_module, setting)
+        # update this dict from global settings (but only for ALL_CAPS settings)
+        self.__dict__.update({
+            setting: getattr(global_settings, setting) for setting in _GLOBAL_SETTINGS_NAMES
+        })
+        self.__dict__.update(user_settings)
 
-                setattr(self, setting, setting_value)
-                self._explicit_settings.add(setting)
+        self._explicit_settings = frozenset(user_settings)
 
         self._check()
 
     def _check(self: 'Self') -> None:
         """Check the settings for gross errors."""
+        # The values are already set on the instance, so there is no need
+        # to look them up in the settings module once again.
         if self._is_overridden('HIDERS_CHECKER_CLASS'):
-            setting_value = getattr(self._settings_module, 'HIDERS_CHECKER_CLASS')  # noqa: B009
+            setting_value = getattr(self, 'HIDERS_CHECKER_CLASS')  # noqa: B009
             if not isinstance(setting_value, type) or not issubclass(setting_value, HidersChecker):
                 msg = 'HIDERS_CHECKER_CLASS must be a subclass of HidersChecker'
                 raise ImproperlyConfigured(msg)
 
         if self._is_overridden('PERMISSIONS'):
-            setting_value = getattr(self._settings_module, 'PERMISSIONS')  # noqa: B009
+            setting_value = getattr(self, 'PERMISSIONS')  # noqa: B009
             if not isinstance(setting_value, list | tuple):
                 msg = "The 'PERMISSIONS' setting must be a list or a tuple."
                 raise ImproperlyConfigured(msg)
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from typing import Any
 
+CONCURRENT_UPDATES: bool | int = False
+
 DOMAIN = 'hammett'
 
 HIDERS_CHECKER = ''
@@ -1,5 +1,6 @@
 """The module contains the implementation of the high-level application class."""
 
+from collections import deque
 from typing import TYPE_CHECKING, Any
 
 from telegram import Update
@@ -19,7 +20,7 @@ from hammett.types import HandlerAlias, HandlerType
 from hammett.utils.log import configure_logging
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
 
     from telegram.ext import BasePersistence
     from telegram.ext._applicationbuilder import ApplicationBuilder
@@ -32,6 +33,115 @@ if TYPE_CHECKING:
 
 __all__ = ('Application', )
 
+_ACCEPTABLE_HANDLER_TYPES = frozenset({
+    HandlerType.BUTTON_HANDLER,
+    HandlerType.COMMAND_HANDLER,
+    HandlerType.INPUT_HANDLER,
+    HandlerType.TYPING_HANDLER,
+})
+
+_ROUTE_HANDLERS = frozenset({'sgoto', 'sjump'})
+
+_BUILTIN_HANDLERS = frozenset({'goto', 'jump', 'start', *_ROUTE_HANDLERS})
+
+_TEXT_WITHOUT_COMMANDS_FILTER = filters.TEXT & (~filters.COMMAND)
+
+
+def _create_button_handler_object(
+    handler: 'HandlerAlias',
+    _possible_handler: 'Handler',
+) -> CallbackQueryHandler[Any]:
+    """Return the handler object for a button handler."""
+    return CallbackQueryHandler(
+        apply_permission_to(handler),
+        # Specify a pattern. The pattern is used to determine which handler
+        # should be triggered when a specific button is pressed.
+        pattern=calc_checksum(handler),
+    )
+
+
+def _create_command_handler_object(
+    handler: 'HandlerAlias',
+    possible_handler: 'Handler',
+) -> MessageHandler[Any]:
+    """Return the handler object for a command handler."""
+    return MessageHandler(possible_handler.command_filter, handler)
+
+
+def _create_input_handler_object(
+    handler: 'HandlerAlias',
+    possible_handler: 'Handler',
+) -> MessageHandler[Any]:
+    """Return the handler object for an input handler."""
+    return MessageHandler(
+        possible_handler.filters,  # type: ignore[arg-type]
+        handler,
+    )
+
+
+def _create_typing_handler_object(
+    handler: 'HandlerAlias',
+    _possible_handler: 'Handler',
+) -> MessageHandler[Any]:
+    """Return the handler object for a typing handler."""
+    return MessageHandler(_TEXT_WITHOUT_COMMANDS_FILTER, handler)
+
+
+# The builtin handlers don't have a type, so they are handled
+# as the button handlers.
+_HANDLER_OBJECT_FACTORIES: dict[
+    'HandlerType | str',
+    'Callable[[HandlerAlias, Handler], CallbackQueryHandler[Any] | MessageHandler[Any]]',
+] = {
+    '': _create_button_handler_object,
+    HandlerType.BUTTON_HANDLER: _create_button_handler_object,
+    HandlerType.COMMAND_HANDLER: _create_command_handler_object,
+    HandlerType.INPUT_HANDLER: _create_input_handler_object,
+    HandlerType.TYPING_HANDLER: _create_typing_handler_object,
+}
+
+
+class _NativeApplication(NativeApplication[Any, Any, Any, Any, Any, Any]):
+    """The class that subclasses the native Application class to process
+    the updates from different chats concurrently (if the CONCURRENT_UPDATES
+    setting allows it), keeping the updates from the same chat in order.
+    """
+
+    def __init__(self: 'Self', **kwargs: 'Any') -> None:
+        """Initialize a native application object."""
+        super().__init__(**kwargs)
+
+        # The updates waiting for the previous updates from the same chat
+        # to be processed. A chat is in the dictionary while its updates
+        # are being processed.
+        self._pending_chat_updates: dict[int, deque[object]] = {}
+
+    async def process_update(self: 'Self', update: object) -> None:
+        """Process the update or, if an update from the same chat is being
+        processed, put it in the queue of the chat.
+        """
+        chat = update.effective_chat if isinstance(update, Update) else None
+        if chat is None or not self.concurrent_updates:
+            await super().process_update(update)
+            return
+
+        pending_updates = self._pending_chat_updates.get(chat.id)
+        if pending_updates is not None:
+            # Don't wait here, since the native application doesn't release
+            # the slot of the update until the method returns. The waiting
+            # updates of a slow chat would otherwise take all the slots and
+            # block the updates from the other chats.
+            pending_updates.append(update)
+            return
+
+        pending_updates = deque([update])
+        self._pending_chat_updates[chat.id] = pending_updates
+        try:
+            while pending_updates:
+                await super().process_update(pending_updates.popleft())
+        finally:
+            del self._pending_chat_updates[chat.id]
+
 
 class Application:
     """The class is a wrapper for the native Application class.
@@ -60,8 +170,6 @@ class Application:
 
         self._setup()
 
-        self._route_handlers = ('sgoto', 'sjump')
-        self._builtin_handlers = ('goto', 'jump', 'start', *self._route_handlers)
         self._entry_point = entry_point()
         self._name = name
         self._native_states = native_states or {}
@@ -80,11 +188,11 @@ class Application:
         self._register_error_handlers(error_handlers)
         self._register_job_queue_handlers(job_queue_handlers)
 
-        start_handler = apply_permission_to(self._entry_point.start)
+        start_handler = CommandHandler('start', apply_permission_to(self._entry_point.start))
         self._native_application.add_handler(ConversationHandler(
-            entry_points=[CommandHandler('start', start_handler)],
+            entry_points=[start_handler],
             states=self._native_states,
-            fallbacks=[CommandHandler('start', start_handler)],
+            fallbacks=[start_handler],
             name=self._name,
             persistent=bool(persistence),
         ))
@@ -96,33 +204,15 @@ class Application:
         possible_handler: 'Handler',
     ) -> CallbackQueryHandler[Any] | MessageHandler[Any]:
         """Return the handler object depending on its type."""
-        handler_object: CallbackQueryHandler[Any] | MessageHandler[Any]
-        if handler_type in (HandlerType.BUTTON_HANDLER, ''):
-            handler_object = CallbackQueryHandler(
-                apply_permission_to(handler),
-                # Specify a pattern. The pattern is used to determine which handler
-                # should be triggered when a specific button is pressed.
-                pattern=calc_checksum(handler),
-            )
-        elif handler_type == HandlerType.COMMAND_HANDLER:
-            handler_object = MessageHandler(
-                filters.COMMAND & filters.Regex(f'^/{possible_handler.command_name}'),
-                handler,
-            )
-        elif handler_type == HandlerType.INPUT_HANDLER:
-            handler_object = MessageHandler(
-                possible_handler.filters,  # type: ignore[arg-type]
-                handler,
-            )
-        elif handler_type == HandlerType.TYPING_HANDLER:
-            handler_object = MessageHandler(
-                filters.TEXT & (~filters.COMMAND),
-                handler,
-            )
-        else:
+        if handler_type is None:
             raise UnknownHandlerType
 
-        return handler_object
+        try:
+            create_handler_object = _HANDLER_OBJECT_FACTORIES[handler_type]
+        except KeyError as exc:
+            raise UnknownHandlerType from exc
+
+        return create_handler_object(handler, possible_handler)
 
     def _register_error_handlers(
         self: 'Self',
@@ -153,23 +243,33 @@ class Application:
                     )
 
     def _register_handlers(self: 'Self', state: 'State', screens: 'Iterable[type[Screen]]') -> None:
-        self._set_default_value_to_native_states(state)
+        state_handlers = self._native_states.setdefault(state, [])
 
         for screen in screens:
             instance = screen()
+
+            # The states the route handlers are registered in are the same
+            # for all of them, so collect the states once per screen.
+            routes = getattr(instance, 'routes', None)
+            route_states = [
+                route_state
+                for states, _ in routes or ()
+                for route_state in states
+            ]
+
             for name in dir(instance):
-                acceptable_handler_types = (
-                    HandlerType.BUTTON_HANDLER,
-                    HandlerType.COMMAND_HANDLER,
-                    HandlerType.INPUT_HANDLER,
-                    HandlerType.TYPING_HANDLER,
-                )
+                # Special methods and attributes are never handlers. Note that
+                # names starting with a single underscore can't be skipped,
+                # since private methods of screens may be registered as handlers.
+                if name.startswith('__'):
+                    continue
+
                 handler, handler_type = None, None
                 possible_handler = getattr(instance, name)
                 possible_handler_type = getattr(possible_handler, 'handler_type', '')
                 if (
-                    name in self._builtin_handlers or
-                    possible_handler_type in acceptable_handler_types
+                    name in _BUILTIN_HANDLERS or
+                    possible_handler_type in _ACCEPTABLE_HANDLER_TYPES
                 ):
                     handler, handler_type = possible_handler, possible_handler_type
 
@@ -179,25 +279,11 @@ class Application:
 
                 handler_object = self._get_handler_object(handler, handler_type, possible_handler)
 
-                if (
-                    hasattr(instance, 'routes')
-                    and name in self._route_handlers
-                    and instance.routes
-                ):
-                    for route in instance.routes:
-                        route_states, _ = route
-                        for route_state in route_states:
-                            self._set_default_value_to_native_states(route_state)
-                            self._native_states[route_state].append(handler_object)
+                if name in _ROUTE_HANDLERS and routes:
+                    for route_state in route_states:
+                        self._native_states.setdefault(route_state, []).append(handler_object)
                 else:
-                    self._native_states[state].append(handler_object)
-
-    def _set_default_value_to_native_states(self: 'Self', state: 'State') -> None:
-        """Set default value to native states."""
-        try:
-            self._native_states[state]
-        except KeyError:
-            self._native_states[state] = []
+                    state_handlers.append(handler_object)
 
     def _setup(self: 'Self') -> None:
         """Configure logging."""
@@ -208,7 +294,12 @@ class Application:
         """Return a native application builder."""
         from hammett.conf import settings
 
-        return NativeApplication.builder().token(settings.TOKEN)
+        return (
+            NativeApplication.builder()
+            .application_class(_NativeApplication)
+            .concurrent_updates(settings.CONCURRENT_UPDATES)
+            .token(settings.TOKEN)
+        )
 
     def run(self: 'Self') -> None:
         """Run the application."""
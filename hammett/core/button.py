@@ -1,6 +1,7 @@
 """The module contains the implementation of the button component that is used in the keyboard."""
 
-from typing import TYPE_CHECKING, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
 
 from telegram import InlineKeyboardButton
 
@@ -18,26 +19,54 @@ if TYPE_CHECKING:
     from hammett.core.hiders import Hider, HidersChecker
     from hammett.types import Handler, Source
 
-_HANDLER_SOURCES_TYPES = (
+_SOURCES_TYPES = frozenset(SourcesTypes)
+
+_HANDLER_SOURCES_TYPES = frozenset({
     SourcesTypes.GOTO_SOURCE_TYPE,
     SourcesTypes.HANDLER_SOURCE_TYPE,
     SourcesTypes.JUMP_SOURCE_TYPE,
     SourcesTypes.SGOTO_SOURCE_TYPE,
     SourcesTypes.SJUMP_SOURCE_TYPE,
-)
+})
 
-_SHORTCUT_SOURCES_TYPES = (
+_SHORTCUT_SOURCES_TYPES = frozenset({
     SourcesTypes.GOTO_SOURCE_TYPE,
     SourcesTypes.JUMP_SOURCE_TYPE,
     SourcesTypes.SGOTO_SOURCE_TYPE,
     SourcesTypes.SJUMP_SOURCE_TYPE,
-)
+})
+
+_SHORTCUT_METHODS_NAMES = {
+    SourcesTypes.GOTO_SOURCE_TYPE: 'goto',
+    SourcesTypes.JUMP_SOURCE_TYPE: 'jump',
+    SourcesTypes.SGOTO_SOURCE_TYPE: 'sgoto',
+    SourcesTypes.SJUMP_SOURCE_TYPE: 'sjump',
+}
+
+
+@lru_cache
+def _get_hiders_checker_class(hiders_checker_path: str) -> 'type[HidersChecker]':
+    """Return the hiders checker class specified by its path."""
+    return import_string(hiders_checker_path)
 
 
 class Button:
     """The class implements the interface of a button."""
 
-    hiders_checker: 'HidersChecker | None' = None
+    # Keyboards may consist of many buttons, so don't give each of them
+    # the instance dictionary.
+    __slots__ = (
+        '_callback_data_prefix',
+        '_caption_checksum',
+        'caption',
+        'hiders',
+        'hiders_checker',
+        'payload',
+        'source',
+        'source_shortcut',
+        'source_type',
+        'source_wrapped',
+    )
 
     def __init__(
         self: 'Self',
@@ -55,7 +84,37 @@ class Button:
         self.source_wrapped = None
         self.source_type = source_type
         self.hiders = hiders
+        self.hiders_checker: HidersChecker | None = None
+        self.source_shortcut: Handler | None = None
+        self._callback_data_prefix = ''
+
+        # The caption doesn't change, so calculate its checksum only once
+        # instead of doing it on every render.
+        self._caption_checksum = handlers.calc_checksum(caption)
+
+        self._check_source()
+        self._init_hider_checker()
+
+    def __setstate__(
+        self: 'Self',
+        state: 'dict[str, Any] | tuple[dict[str, Any] | None, dict[str, Any]]',
+    ) -> None:
+        """Restore the button from its pickled state. The state is either
+        the slots state or the instance dictionary of the buttons pickled
+        before the slots were introduced (for example, by RedisPersistence).
+        """
+        if isinstance(state, tuple):
+            dict_state, slots_state = state
+            state = {**(dict_state or {}), **slots_state}
+
+        self.hiders_checker = None
+        self.source_shortcut = None
+        self.source_wrapped = None
+        self._callback_data_prefix = ''
+        for name, value in state.items():
+            setattr(self, name, value)
 
+        self._caption_checksum = handlers.calc_checksum(self.caption)
         self._check_source()
         self._init_hider_checker()
 
@@ -64,24 +123,21 @@ class Button:
     #
 
     def _check_source(self: 'Self') -> None:
-        """Check if the source is valid. If it's invalid, the method raises `TypeError`."""
+        """Check if the source is valid and prepare the callback data prefix
+        of the button. If the source is invalid, the method raises `TypeError`.
+        If the source type is unknown, the method raises `UnknownSourceType`.
+        """
         from hammett.core.screen import Screen
 
+        if self.source_type not in _SOURCES_TYPES:
+            raise UnknownSourceType
+
         if self.source_type in _SHORTCUT_SOURCES_TYPES:
             screen = cast('type[Screen]', self.source)
             if issubclass(screen, Screen):
-                if self.source_type == SourcesTypes.GOTO_SOURCE_TYPE:
-                    self.source_shortcut = cast('Handler', screen().goto)
-                elif self.source_type == SourcesTypes.JUMP_SOURCE_TYPE:
-                    self.source_shortcut = cast('Handler', screen().jump)
-                elif self.source_type == SourcesTypes.SGOTO_SOURCE_TYPE:
-                    self.source_shortcut = cast(
-                        'Handler', screen().sgoto,  # type: ignore[attr-defined]
-                    )
-                else:
-                    self.source_shortcut = cast(
-                        'Handler', screen().sjump,   # type: ignore[attr-defined]
-                    )
+                self.source_shortcut = cast(
+                    'Handler', getattr(screen(), _SHORTCUT_METHODS_NAMES[self.source_type]),
+                )
             else:
                 msg = (
                     f'The source "{self.source}" must be a subclass of Screen if its '
@@ -97,16 +153,26 @@ class Button:
             )
             raise TypeError(msg)
 
-    @staticmethod
-    def _get_user_id(
-        update: 'Update | None',
-        context: 'CallbackContext[BT, UD, CD, BD]',
-    ) -> int | None:
-        """Obtain the user ID from either an Update object or a CallbackContext object."""
-        if update is None:
-            return context._user_id  # noqa: SLF001
+        if self.source_type == SourcesTypes.URL_SOURCE_TYPE and not isinstance(self.source, str):
+            msg = (
+                f'The source "{self.source}" must be a string if its '
+                f'source_type is SourcesTypes.URL_SOURCE_TYPE'
+            )
+            raise TypeError(msg)
+
+        # The source doesn't change, so calculate its checksum only once
+        # instead of doing it on every render. The same goes for the part
+        # of the callback data that doesn't depend on the user.
+        if self.source_type in _SHORTCUT_SOURCES_TYPES:
+            source_checksum = handlers.calc_checksum(self.source_shortcut)
+        elif self.source_type in _HANDLER_SOURCES_TYPES:
+            source_checksum = handlers.calc_checksum(self.source)
+        else:
+            return
 
-        return update.effective_user.id  # type: ignore[union-attr]
+        self._callback_data_prefix = (
+            f'{source_checksum},button={self._caption_checksum},user_id='
+        )
 
     def _init_hider_checker(self: 'Self') -> None:
         if self.hiders and not self.hiders_checker:
@@ -117,7 +183,7 @@ class Button:
                 raise ImproperlyConfigured(msg)
 
             if self.hiders:
-                hiders_checker: type[HidersChecker] = import_string(settings.HIDERS_CHECKER)
+                hiders_checker = _get_hiders_checker_class(settings.HIDERS_CHECKER)
                 self.hiders_checker = hiders_checker(self.hiders.hiders_set)
 
     async def _specify_visibility(
@@ -143,21 +209,21 @@ class Button:
         self: 'Self',
         update: 'Update | None',
         context: 'CallbackContext[BT, UD, CD, BD]',
-    ) -> tuple[InlineKeyboardButton, bool]:
-        """Create the button."""
+    ) -> tuple[InlineKeyboardButton | None, bool]:
+        """Create the button and return it along with its visibility.
+        If the button is hidden, return None instead of the button.
+        """
         visibility = await self._specify_visibility(update, context)
+        if not visibility:
+            # Hidden buttons are not sent, so don't build the callback data
+            # and don't put the payload in the storage.
+            return None, visibility
 
         if self.source_type in _HANDLER_SOURCES_TYPES:
-            if self.source_type in _SHORTCUT_SOURCES_TYPES and self.source_shortcut:
-                source = self.source_shortcut
-            else:
-                source = cast('Handler', self.source)
+            # Obtain the user ID from either the Update object or the CallbackContext object.
+            user_id = context._user_id if update is None else update.effective_user.id  # type: ignore[union-attr]  # noqa: SLF001
 
-            data = (
-                f'{handlers.calc_checksum(source)},'
-                f'button={handlers.calc_checksum(self.caption)},'
-                f'user_id={self._get_user_id(update, context)}'
-            )
+            data = f'{self._callback_data_prefix}{user_id}'
 
             if self.payload is not None:
                 payload_storage = handlers.get_payload_storage(context)
@@ -165,7 +231,6 @@ class Button:
 
             return InlineKeyboardButton(self.caption, callback_data=data), visibility
 
-        if self.source_type == SourcesTypes.URL_SOURCE_TYPE and isinstance(self.source, str):
-            return InlineKeyboardButton(self.caption, url=self.source), visibility
-
-        raise UnknownSourceType
+        # The source type is checked when the button is created, so the only
+        # type left is URL_SOURCE_TYPE. The source is checked to be a string too.
+        return InlineKeyboardButton(self.caption, url=cast('str', self.source)), visibility
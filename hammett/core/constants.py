@@ -1,7 +1,7 @@
 """The module contains the constants used in the core."""
 
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import TYPE_CHECKING, TypedDict, cast
 
 if TYPE_CHECKING:
@@ -12,12 +12,12 @@ if TYPE_CHECKING:
 # Use 'cast' instead of 'State(0)' to avoid a circular import
 DEFAULT_STATE = cast('State', '0')
 
-EMPTY_KEYBOARD: 'Keyboard' = []
+EMPTY_KEYBOARD: 'Keyboard' = ()
 
 LATEST_SENT_MSG_KEY = 'latest_sent_msg'
 
 
-class SourcesTypes(Enum):
+class SourcesTypes(IntEnum):
     """The class contains the available types of sources."""
 
     GOTO_SOURCE_TYPE = auto()
@@ -7,6 +7,8 @@ from contextlib import suppress
 from functools import wraps
 from typing import TYPE_CHECKING, Any, cast
 
+from telegram.ext.filters import COMMAND, Regex
+
 from hammett.core.exceptions import CommandNameIsEmpty
 from hammett.types import HandlerAlias, HandlerType, State
 
@@ -70,6 +72,10 @@ def _register_handler(
                     )
                     raise CommandNameIsEmpty(msg) from exc
 
+                # Build the filter once, instead of compiling the regex every time
+                # the handler is registered.
+                handler.command_filter = COMMAND & Regex(f'^/{handler.command_name}')
+
             @wraps(handler)
             async def wrapper(
                 *args: 'Any',
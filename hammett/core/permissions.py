@@ -1,7 +1,7 @@
 """The module contains the implementation of the permissions mechanism."""
 
 import asyncio
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import TYPE_CHECKING, Any, cast
 from uuid import uuid4
 
@@ -19,15 +19,19 @@ if TYPE_CHECKING:
     from hammett.types import Handler, HandlerAlias, State
 
 
+@lru_cache
+def _get_permissions(permission_paths: 'tuple[str, ...]') -> 'tuple[Permission, ...]':
+    """Return the instances of the permissions specified by their paths."""
+    return tuple(import_string(permission_path)() for permission_path in permission_paths)
+
+
 def apply_permission_to(handler: 'HandlerAlias') -> 'HandlerAlias':
     """Apply permissions to the specified handler."""
     from hammett.conf import settings
 
     handler_wrapped = cast('Handler', handler)
-    for permission_path in reversed(settings.PERMISSIONS):
-        permission: type[Permission] = import_string(permission_path)
+    for permission_instance in reversed(_get_permissions(tuple(settings.PERMISSIONS))):
         permissions_ignored = getattr(handler_wrapped, 'permissions_ignored', None)
-        permission_instance = permission()
         if permissions_ignored and permission_instance.class_uuid in permissions_ignored:
             continue
 
@@ -58,6 +58,7 @@ class Screen:
     document: 'Document | None' = None
     html_parse_mode: 'ParseMode | DefaultValue[None]' = DEFAULT_NONE
     hide_keyboard: bool = False
+    keyboard: 'Keyboard' = EMPTY_KEYBOARD
 
     _cached_covers: dict[str | PathLike[str], str] = {}
     _initialized: bool = False
@@ -74,10 +75,14 @@ class Screen:
 
     def __new__(cls: type['Screen'], *args: 'Any', **kwargs: 'Any') -> 'Screen':
         """Implement the singleton pattern."""
-        if not cls._instance:
-            cls._instance = super().__new__(cls, *args, **kwargs)
+        # Look for the instance in the dictionary of the class itself
+        # to prevent subclasses from getting the instance of their parent.
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__new__(cls, *args, **kwargs)
+            cls._instance = instance
 
-        return cls._instance
+        return instance
 
     #
     # Private methods
@@ -123,8 +128,9 @@ class Screen:
         for row in rows:
             buttons = []
             for button in row:
-                inline_button, visible = await button.create(update, context)
-                if visible:
+                # Hidden buttons are returned as None.
+                inline_button, _ = await button.create(update, context)
+                if inline_button is not None:
                     buttons.append(inline_button)
 
             keyboard.append(buttons)
@@ -406,8 +412,8 @@ class Screen:
         _update: 'Update | None',
         _context: 'CallbackContext[BT, UD, CD, BD]',
     ) -> 'Keyboard':
-        """Set up the default keyboard for the screen."""
-        return EMPTY_KEYBOARD
+        """Return the `keyboard` attribute of the screen."""
+        return self.keyboard
 
     async def get_cache_covers(
         self: 'Self',
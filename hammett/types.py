@@ -28,7 +28,7 @@ class Document(TypedDict):
     name: str
 
 
-Keyboard = list[list[Button]]
+Keyboard = Sequence[Sequence[Button]]
 
 NativeStates = dict[object, list[BaseHandler]]  # type: ignore[type-arg]
 
@@ -61,6 +61,7 @@ class Handler(Protocol):
     __name__: str
     __self__: Screen
     __qualname__: str
+    command_filter: BaseFilter
     command_name: str
     filters: BaseFilter | None
     handler_type: HandlerType
@@ -260,7 +260,7 @@ class BaseChoiceWidget(BaseWidget):
                 ),
             ])
 
-        return keyboard + await self.add_extra_keyboard(update, context)
+        return [*keyboard, *await self.add_extra_keyboard(update, context)]
 
     async def _init(
         self: 'Self',
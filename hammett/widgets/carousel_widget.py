@@ -82,8 +82,10 @@ class CarouselWidget(BaseWidget):
             config.description = description or self.description
 
         if self.infinity:
-            config.keyboard = (self._infinity_keyboard +
-                               await self.add_extra_keyboard(update, context))
+            config.keyboard = [
+                *self._infinity_keyboard,
+                *await self.add_extra_keyboard(update, context),
+            ]
         else:
             config.keyboard = await self._build_keyboard(
                 update,
@@ -209,7 +211,10 @@ class CarouselWidget(BaseWidget):
         config = RenderConfig(
             description=description or self.description,
             cover=cover,
-            keyboard=self._infinity_keyboard + await self.add_extra_keyboard(update, context),
+            keyboard=[
+                *self._infinity_keyboard,
+                *await self.add_extra_keyboard(update, context),
+            ],
         )
         return await self.render(update, context, config=config)
 
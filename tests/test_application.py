@@ -2,10 +2,13 @@
 
 # ruff: noqa: ANN001, ANN101, ANN201, ANN202, D401, S106, SLF001
 
+import asyncio
 import logging
 import re
+from datetime import datetime, timezone
 
-from telegram.ext import CommandHandler
+from telegram import Chat, Message, Update
+from telegram.ext import CommandHandler, TypeHandler
 
 from hammett.core import Application
 from hammett.core.button import Button
@@ -18,6 +21,8 @@ from tests.base import TestScreen, TestStartScreen
 
 _APPLICATION_TEST_NAME = 'test'
 
+_TIMEOUT = 1
+
 _TEST_LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -73,6 +78,12 @@ class TestScreenWithPermissionIgnored(TestScreen):
         ]
 
 
+def _create_update(update_id, chat_id):
+    """Returns an update with a message from the specified chat."""
+    chat = Chat(chat_id, Chat.PRIVATE)
+    return Update(update_id, message=Message(update_id, datetime.now(tz=timezone.utc), chat))
+
+
 class ApplicationTests(BaseTestCase):
     """The class implements the tests for the application."""
 
@@ -122,6 +133,14 @@ class ApplicationTests(BaseTestCase):
             logging.INFO,
         )
 
+    @override_settings(CONCURRENT_UPDATES=8, TOKEN='secret-token')
+    def test_app_init_with_concurrent_updates(self):
+        """Tests the case when an application is initialized with
+        an overriden CONCURRENT_UPDATES setting.
+        """
+        app = self._init_application()
+        self.assertEqual(app._native_application.concurrent_updates, 8)
+
     @override_settings(PERMISSIONS=['tests.base.TestDenyingPermission'], TOKEN='secret-token')
     def test_app_init_with_permissions_specified(self):
         """Tests the case when an application is initialized with
@@ -131,3 +150,41 @@ class ApplicationTests(BaseTestCase):
         handlers = app._native_application.handlers[0][0]
         is_wrapped = getattr(handlers.states[DEFAULT_STATE][0].callback, '__wrapped__', None)
         self.assertIsNotNone(is_wrapped)
+
+    @override_settings(CONCURRENT_UPDATES=8, TOKEN='secret-token')
+    async def test_concurrent_updates_from_same_and_different_chats(self):
+        """Tests the case when the updates from the same chat are processed
+        in order, while the updates from the other chats are not blocked by them.
+        """
+        native_application = self._init_application()._native_application
+        first_update_started = asyncio.Event()
+        first_update_released = asyncio.Event()
+        processed_updates = []
+
+        async def handler(update, _context):
+            if update.update_id == 1:
+                first_update_started.set()
+                await first_update_released.wait()
+
+            processed_updates.append(update.update_id)
+
+        native_application.add_handler(TypeHandler(Update, handler), group=-1)
+
+        first_update = asyncio.create_task(
+            native_application.process_update(_create_update(1, chat_id=1)),
+        )
+        await asyncio.wait_for(first_update_started.wait(), _TIMEOUT)
+
+        # The update from the busy chat must be queued without waiting,
+        # and the update from the other chat must be processed at once.
+        await asyncio.wait_for(
+            native_application.process_update(_create_update(2, chat_id=1)), _TIMEOUT,
+        )
+        await asyncio.wait_for(
+            native_application.process_update(_create_update(3, chat_id=2)), _TIMEOUT,
+        )
+        self.assertEqual(processed_updates, [3])
+
+        first_update_released.set()
+        await asyncio.wait_for(first_update, _TIMEOUT)
+        self.assertEqual(processed_updates, [3, 1, 2])
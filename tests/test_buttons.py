@@ -1,22 +1,43 @@
 """The module contains the tests for buttons."""
 
-# ruff: noqa: ANN101, ANN201
+# ruff: noqa: ANN101, ANN201, S301
+
+import pickle
+from typing import Any
 
 from hammett.core.button import Button
 from hammett.core.constants import SourcesTypes
 from hammett.core.exceptions import UnknownSourceType
+from hammett.core.hiders import ONLY_FOR_ADMIN, Hider
 from hammett.test.base import BaseTestCase
+from hammett.test.utils import override_settings
 from tests.base import TestScreen
 
 _TEST_PAYLOAD = 'test payload'
 
 _UNKNOWN_SOURCE_TYPE = 100
 
+_URL = 'https://github.com/cusdeb-com/hammett'
+
 
 class AnythingElseButScreen:
     """A dummy class used for the testing purposes."""
 
 
+class ButtonWithoutSlots:
+    """The class is pickled the way the buttons were pickled before
+    the slots were introduced, i.e. along with their instance dictionary.
+    """
+
+    def __init__(self, state: dict[str, Any]) -> None:
+        """Initialize a button without slots object."""
+        self.state = state
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Return the pickled state of a button with the instance dictionary."""
+        return object.__new__, (Button,), self.state
+
+
 class ButtonsTests(BaseTestCase):
     """The class implements the tests for buttons."""
 
@@ -39,6 +60,19 @@ class ButtonsTests(BaseTestCase):
             )
             await button.create(self.update, self.context)
 
+    @override_settings(HIDERS_CHECKER='tests.test_hiders_check_mechanism.TestHidersChecker')
+    def test_unknown_source_type_of_hidden_button(self):
+        """Tests the case when an unknown source type passed to a button
+        which may be hidden.
+        """
+        with self.assertRaises(UnknownSourceType):
+            Button(
+                'Test',
+                TestScreen,
+                hiders=Hider(ONLY_FOR_ADMIN),
+                source_type=_UNKNOWN_SOURCE_TYPE,
+            )
+
     async def test_using_random_class_instead_of_screen_for_goto(self):
         """Tests the case when the source type is `GOTO_SOURCE_TYPE` but
         the source isn't a subclass of Screen.
@@ -49,3 +83,47 @@ class ButtonsTests(BaseTestCase):
                 AnythingElseButScreen,  # is not a subclass of Screen, so it's invalid
                 source_type=SourcesTypes.GOTO_SOURCE_TYPE,
             )
+
+    async def test_non_string_source_as_url(self):
+        """Tests the case when the source type is `URL_SOURCE_TYPE` but
+        the source isn't a string.
+        """
+        with self.assertRaises(TypeError):
+            Button(
+                'Test',
+                TestScreen,  # is not a string, so it's invalid
+                source_type=SourcesTypes.URL_SOURCE_TYPE,
+            )
+
+    async def test_unpickling_button_pickled_without_slots(self):
+        """Tests the case when a button pickled before the slots were
+        introduced is unpickled.
+        """
+        state = {
+            'caption': 'Test',
+            'payload': None,
+            'source': _URL,
+            'source_wrapped': None,
+            'source_type': SourcesTypes.URL_SOURCE_TYPE,
+            'hiders': None,
+        }
+        button = pickle.loads(pickle.dumps(ButtonWithoutSlots(state)))
+        inline_button, visibility = await button.create(self.update, self.context)
+
+        self.assertIsInstance(button, Button)
+        self.assertTrue(visibility)
+        self.assertEqual(inline_button.url, _URL)
+
+    async def test_pickling_button(self):
+        """Tests the case when a button is pickled and unpickled."""
+        button = Button(
+            'Test',
+            _URL,
+            source_type=SourcesTypes.URL_SOURCE_TYPE,
+            payload=_TEST_PAYLOAD,
+        )
+        unpickled_button = pickle.loads(pickle.dumps(button))
+
+        self.assertEqual(unpickled_button.caption, button.caption)
+        self.assertEqual(unpickled_button.payload, _TEST_PAYLOAD)
+        self.assertEqual(unpickled_button.source, _URL)
@@ -0,0 +1,54 @@
+"""The module contains the tests for screens."""
+
+# ruff: noqa: ANN101, ANN201
+
+from hammett.core.button import Button
+from hammett.core.constants import EMPTY_KEYBOARD, SourcesTypes
+from hammett.test.base import BaseTestCase
+from tests.base import TestScreen
+
+_TEST_URL = 'https://github.com/cusdeb-com/hammett'
+
+
+class TestInheritedScreen(TestScreen):
+    """The class implements a screen inherited from another screen."""
+
+
+class TestScreenWithKeyboardAttribute(TestScreen):
+    """The class implements a screen with a keyboard for the tests."""
+
+    keyboard = ((
+        Button('Test button', _TEST_URL, source_type=SourcesTypes.URL_SOURCE_TYPE),
+    ),)
+
+
+class ScreensTests(BaseTestCase):
+    """The class implements the tests for screens."""
+
+    def test_screen_is_singleton(self):
+        """Tests the case when a screen is instantiated several times."""
+        self.assertIs(TestScreen(), TestScreen())
+
+    def test_inherited_screen_has_its_own_instance(self):
+        """Tests the case when a screen inherits from the screen
+        which has already been instantiated.
+        """
+        parent = TestScreen()
+        child = TestInheritedScreen()
+
+        self.assertIsInstance(child, TestInheritedScreen)
+        self.assertIsNot(child, parent)
+        self.assertIs(child, TestInheritedScreen())
+
+    async def test_default_keyboard(self):
+        """Tests the case when a screen doesn't specify a keyboard."""
+        keyboard = await TestScreen().add_default_keyboard(self.update, self.context)
+        self.assertEqual(keyboard, EMPTY_KEYBOARD)
+
+    async def test_keyboard_attribute(self):
+        """Tests the case when a screen specifies a keyboard
+        via the keyboard attribute.
+        """
+        screen = TestScreenWithKeyboardAttribute()
+        keyboard = await screen.add_default_keyboard(self.update, self.context)
+        self.assertIs(keyboard, TestScreenWithKeyboardAttribute.keyboard)